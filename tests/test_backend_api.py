@@ -0,0 +1,73 @@
+"""pytest wrappers for the TankPitBotAPITester checks in backend_test.py.
+
+They talk to a live backend, so they only run when asked for:
+
+    BACKEND_API_TESTS=1 pytest tests/test_backend_api.py
+
+Each case gets its own tester, so no case depends on a login or a bot start made
+by an earlier one. With pytest-xdist installed the cases can be sharded with
+`-n auto --dist loadgroup`; the ones that drive the server's single bot share a
+worker.
+"""
+import importlib.util
+import os
+
+import pytest
+
+if not os.environ.get("BACKEND_API_TESTS"):
+    pytest.skip("set BACKEND_API_TESTS=1 to run the live backend API tests", allow_module_level=True)
+
+from backend_test import TankPitBotAPITester, _log_to_stdout
+
+# Tests that start/stop/log in the server's single bot (or use display :99) must
+# share one xdist worker; the rest are reflection checks or read-only requests
+BOT_STATE_TESTS = frozenset({
+    'test_bot_settings_update',
+    'test_bot_login_comprehensive',
+    'test_xvfb_integration',
+    'test_playwright_browser_startup',
+    'test_tank_detection_after_login',
+    'test_get_tanks',
+    'test_start_bot',
+    'test_stop_bot',
+    'test_select_tank',
+    'test_fuel_detection_integration',
+    'test_bot_cycle_logic',
+    'test_bot_status_idle_state',
+    'test_bot_startup_without_crashes',
+    'test_login_overlay_issue',
+    'test_browser_session_management',
+    'test_page_state_after_login',
+    'test_click_interception_detection',
+    'test_complete_login_to_tank_workflow'
+})
+# Aliases of other tests, not worth running twice
+SKIPPED_ALIASES = frozenset({'test_bot_login'})
+
+# xdist_group is only a known mark when pytest-xdist is installed
+_XDIST = importlib.util.find_spec("xdist") is not None
+
+
+def _case(method_name):
+    marks = [pytest.mark.xdist_group("bot_state")] if _XDIST and method_name in BOT_STATE_TESTS else []
+    return pytest.param(method_name, marks=marks, id=method_name)
+
+
+@pytest.fixture
+def tester():
+    # Result lines go to stdout as under main(), so pytest shows them with a failing case
+    with _log_to_stdout(), TankPitBotAPITester() as api_tester:
+        yield api_tester
+
+
+@pytest.mark.parametrize("method_name", [
+    _case(name) for name in dir(TankPitBotAPITester)
+    if name.startswith('test_') and name not in SKIPPED_ALIASES
+])
+def test_backend_api(tester, method_name):
+    # Most test methods return True even after logging a failed sub-check, so the
+    # rows logged during the call decide the case as well as its return value
+    returned = getattr(tester, method_name)()
+    failed = [row["line"] for row in tester.test_results if not row["success"]]
+    assert not failed, f"{method_name} logged failures:\n" + "\n".join(failed)
+    assert returned, f"{method_name} reported failure"